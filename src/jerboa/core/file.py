@@ -119,7 +119,7 @@ class PathProcessor:
             local_path = Path(url.toLocalFile())
             if not local_path.exists():
                 error_message = self._local_file_not_found_msg.format(path=local_path)
-            if not local_path.is_file():
+            elif not local_path.is_file():
                 error_message = self._not_a_file_msg.format(path=local_path)
 
         if error_message is not None:
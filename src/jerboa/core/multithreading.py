@@ -793,7 +793,7 @@ class ThreadSpawner(ABC):
 class PyThreadPool(ThreadPool):
     def __init__(self, workers: int | None = None):
         super().__init__()
-        self._thread_pool = ThreadPoolExecutor(workers)
+        self._thread_pool = ThreadPoolExecutor(workers, thread_name_prefix="PyThreadPool")
         self._running_tasks = dict[int, FnTask]()
 
     def start(self, task: FnTask[T1]) -> Task.Future[T1]:
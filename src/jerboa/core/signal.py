@@ -24,7 +24,11 @@ from jerboa.log import logger
 
 
 class Signal:
+    __slots__ = ("_arg_names", "_subscribers", "_max_subscribers", "_mutex")
+
     class Promise:
+        __slots__ = ("_fulfill_num", "_condition")
+
         class AlreadyFulfilledError(Exception):
             ...
 
@@ -58,7 +62,7 @@ class Signal:
                 if not self._condition.wait_for(lambda: self.is_fulfilled, timeout=timeout):
                     raise TimeoutError("Promise not fulfilled in time")
 
-    @dataclass
+    @dataclass(slots=True)
     class EmitArg:
         slot_kwargs: dict
         promise: "Signal.Promise"
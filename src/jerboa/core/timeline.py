@@ -115,6 +115,7 @@ class FragmentedTimeline:
             *init_sections: Optional initial sections to add to the timeline.
         """
         self._sections: list[TMSection] = []
+        self._section_ends: list[float] = []  # kept parallel to `_sections` for lookups
         self._resulting_timepoints: list[float] = []
         self._time_scope = -math.inf
 
@@ -190,9 +191,11 @@ class FragmentedTimeline:
                 sections_merge = self._sections[-1].merged(section) if self._sections else None
                 if sections_merge is not None:
                     self._sections[-1] = sections_merge
+                    self._section_ends[-1] = sections_merge.end
                     self._resulting_timepoints[-1] += section_duration
                 else:
                     self._sections.append(section)
+                    self._section_ends.append(section.end)
                     last_timepoint = (
                         self._resulting_timepoints[-1] if self._resulting_timepoints else 0.0
                     )
@@ -257,7 +260,7 @@ class FragmentedTimeline:
                 return (None, None)
 
             involved_sections = list[TMSection]()
-            idx = bisect_left(self._sections, beg, key=lambda s: s.end)  # TODO(OPT): don't use key
+            idx = bisect_left(self._section_ends, beg)
             if idx >= len(self._sections):
                 mapped_beg = self._sections[-1].end if self._sections else 0
                 mapped_end = mapped_beg
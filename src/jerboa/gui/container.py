@@ -74,7 +74,7 @@ class Container(containers.DeclarativeContainer):
     menu_bar_file_open = providers.Singleton(
         menu_bar.MenuAction,
         name="Open",
-        signal=providers.Factory(core.signal.QtSignal),
+        signal=providers.Singleton(core.signal.QtSignal),
     )
     menu_bar_file = providers.Singleton(
         menu_bar.Menu,
@@ -87,7 +87,7 @@ class Container(containers.DeclarativeContainer):
     menu_bar_algorithms = providers.Singleton(
         menu_bar.MenuAction,
         name="Algorithms",
-        signal=providers.Factory(core.signal.QtSignal),
+        signal=providers.Singleton(core.signal.QtSignal),
     )
 
     jb_menu_bar = providers.Singleton(
@@ -198,9 +198,10 @@ class Container(containers.DeclarativeContainer):
             ),
         ),
         button_box=providers.Factory(common.button_box.RejectAcceptButtonBox),
-        recognizer=providers.Factory(MediaSourceRecognizer, thread_pool=thread_pool),
-        recognizer_success_signal=providers.Factory(core.signal.QtSignal, "media_source"),
-        recognizer_failure_signal=providers.Factory(core.signal.QtSignal, "error_message"),
+        recognizer=providers.Singleton(MediaSourceRecognizer, thread_pool=thread_pool),
+        recognizer_finished_signal=providers.Singleton(
+            core.signal.QtSignal, "media_source", "error_message"
+        ),
         media_source_selected_signal=media_source_selected_signal,
         show_error_message_signal=show_error_message_signal,
         parent=jb_main_window,
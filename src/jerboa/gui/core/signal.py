@@ -22,6 +22,8 @@ from jerboa.core.signal import Signal
 
 
 class QtSignal(Signal):
+    __slots__ = ("_signal_wrapper",)
+
     class SignalWrapper(QtC.QObject):
         signal = QtC.Signal(Signal.EmitArg)
 
@@ -42,8 +42,7 @@ class Dialog(QtW.QDialog):
         media_source_resolver: MediaSourceResolver,
         button_box: RejectAcceptButtonBox,
         recognizer: MediaSourceRecognizer,
-        recognizer_success_signal: Signal,
-        recognizer_failure_signal: Signal,
+        recognizer_finished_signal: Signal,
         media_source_selected_signal: Signal,
         show_error_message_signal: Signal,
         parent: QtW.QWidget | None = None,
@@ -73,10 +72,8 @@ class Dialog(QtW.QDialog):
         self._recognizer = recognizer
         self._recognizer_task_future: Task.Future | None = None
 
-        self._recognizer_success_signal = recognizer_success_signal
-        self._recognizer_failure_signal = recognizer_failure_signal
-        self._recognizer_success_signal.connect(self._on_media_source_recognition_success)
-        self._recognizer_failure_signal.connect(self._on_media_source_recognition_failure)
+        self._recognizer_finished_signal = recognizer_finished_signal
+        self._recognizer_finished_signal.connect(self._on_media_source_recognition_finished)
         self._media_source_selected_signal = media_source_selected_signal
         self._show_error_message_signal = show_error_message_signal
 
@@ -125,10 +122,19 @@ class Dialog(QtW.QDialog):
             self._recognizer_task_future.abort()
         self._recognizer_task_future = self._recognizer.recognize(
             media_source_path,
-            success_signal=self._recognizer_success_signal,
-            failure_signal=self._recognizer_failure_signal,
+            finished_signal=self._recognizer_finished_signal,
         )
 
+    def _on_media_source_recognition_finished(
+        self,
+        media_source: MediaSource | None,
+        error_message: str | None,
+    ) -> None:
+        if media_source is not None:
+            self._on_media_source_recognition_success(media_source)
+        else:
+            self._on_media_source_recognition_failure(error_message)
+
     def _on_media_source_recognition_success(self, media_source: MediaSource) -> None:
         self._media_source = media_source
         if media_source.is_resolved:
@@ -21,6 +21,7 @@ if __name__ == "__main__":
 
 # pylint: disable=wrong-import-position
 import sys
+import argparse
 from dependency_injector import containers, providers
 
 from PySide6 import QtWidgets as QtW
@@ -29,7 +30,7 @@ from jerboa import core
 from jerboa import analysis
 from jerboa import media
 from jerboa import gui
-from jerboa.settings import Settings
+from jerboa.settings import Settings, PROJECT_NAME, PROJECT_VERSION
 from jerboa.log import logger
 
 
@@ -74,12 +75,8 @@ class Container(containers.DeclarativeContainer):
 
     # -------------------------------------- Multithreading -------------------------------------- #
 
-    thread_spawner = providers.Singleton(
-        gui.core.multithreading.QtThreadSpawner
-        # core.multithreading.PyThreadSpawner
-    )
+    thread_spawner = providers.Singleton(gui.core.multithreading.QtThreadSpawner)
     thread_pool = providers.Singleton(
-        # gui.core.multithreading.QtThreadPool,
         core.multithreading.PyThreadPool,
         workers=8,
     )
@@ -89,9 +86,6 @@ class Container(containers.DeclarativeContainer):
     timeline = providers.Singleton(
         core.timeline.FragmentedTimeline,
         init_sections=[core.timeline.TMSection(0, float("inf"), 1)],
-        # init_sections=[
-        #     core.timeline.TMSection(i * 3, i * 3 + 3, (2 - (i % 3)) / 2) for i in range(1000)
-        # ],
     )
 
     # ------------------------------------- AlgorithmRegistry ------------------------------------ #
@@ -133,17 +127,17 @@ class Container(containers.DeclarativeContainer):
     audio_player = providers.Singleton(
         media.player.audio_player.AudioPlayer,
         audio_manager=audio_manager,
-        fatal_error_signal=providers.Factory(gui.core.signal.QtSignal),
-        buffer_underrun_signal=providers.Factory(gui.core.signal.QtSignal),
-        eof_signal=providers.Factory(gui.core.signal.QtSignal),
+        fatal_error_signal=providers.Singleton(gui.core.signal.QtSignal),
+        buffer_underrun_signal=providers.Singleton(gui.core.signal.QtSignal),
+        eof_signal=providers.Singleton(gui.core.signal.QtSignal),
     )
 
     video_player = providers.Singleton(
         media.player.video_player.VideoPlayer,
         thread_spawner=thread_spawner,
-        fatal_error_signal=providers.Factory(gui.core.signal.QtSignal),
-        buffer_underrun_signal=providers.Factory(gui.core.signal.QtSignal),
-        eof_signal=providers.Factory(gui.core.signal.QtSignal),
+        fatal_error_signal=providers.Singleton(gui.core.signal.QtSignal),
+        buffer_underrun_signal=providers.Singleton(gui.core.signal.QtSignal),
+        eof_signal=providers.Singleton(gui.core.signal.QtSignal),
         video_frame_update_signal=video_frame_update_signal,
     )
 
@@ -158,11 +152,12 @@ class Container(containers.DeclarativeContainer):
         video_decoder_factory=providers.Factory(
             media.player.decoding.decoder.create_video_decoder,
             thread_spawner=thread_spawner,
+            thread_pool=thread_pool,
         ).provider,
         timeline=timeline,
         thread_pool=thread_pool,
         thread_spawner=thread_spawner,
-        fatal_error_signal=providers.Factory(gui.core.signal.QtSignal),
+        fatal_error_signal=providers.Singleton(gui.core.signal.QtSignal),
         ready_to_play_signal=ready_to_play_signal,
     )
 
@@ -184,9 +179,17 @@ class Container(containers.DeclarativeContainer):
 
 
 def main():
+    parse_args()  # exits early on `--help`/`--version`, before Qt gets initialized
+
     logger.initialize(name="Main")
 
     core_c = Container()
+
+    # QApplication has to be created in the main thread, but the analysis management process can
+    # be spawned before that, so its startup overlaps with Qt's initialization
+    core_c.analysis_manager()
+    core_c.qt_app()  # has to exist before any widget is created in `connect_signals`
+
     connect_signals(core_c)
 
     core_c.analysis_alg_registry().register_all()
@@ -194,32 +197,42 @@ def main():
     sys.exit(run_gui(core_c.gui_container()))
 
 
+def parse_args() -> None:
+    parser = argparse.ArgumentParser(prog=PROJECT_NAME, description="AI-powered media player")
+    parser.add_argument("--version", action="version", version=f"%(prog)s {PROJECT_VERSION}")
+    parser.parse_args()
+
+
 def connect_signals(core_c: Container) -> None:
     gui_c = core_c.gui_container()
 
     # ----------------------------------- media player signals ----------------------------------- #
 
-    core_c.media_source_selected_signal().connect(core_c.media_player().initialize)
-    core_c.playback_toggle_signal().connect(core_c.media_player().playback_toggle)
-    core_c.seek_backward_signal().connect(core_c.media_player().seek_backward)
-    core_c.seek_forward_signal().connect(core_c.media_player().seek_forward)
+    # the media player (with its audio and video threads) is created on first use, so it stays out
+    # of the startup path
+    media_player_provider = core_c.media_player
+    core_c.media_source_selected_signal().connect(
+        lambda media_source: media_player_provider().initialize(media_source)
+    )
+    core_c.playback_toggle_signal().connect(lambda: media_player_provider().playback_toggle())
+    core_c.seek_backward_signal().connect(lambda: media_player_provider().seek_backward())
+    core_c.seek_forward_signal().connect(lambda: media_player_provider().seek_forward())
 
     core_c.ready_to_play_signal().connect(gui_c.jb_main_page_stack().show_player_page)
     core_c.video_frame_update_signal().connect(gui_c.player_page_canvas().update_frame)
 
     # -------------------------------- algorithm registry signals -------------------------------- #
 
-    core_c.analysis_alg_registered_signal().connect(
-        gui_c.analysis_alg_registry_dialog().add_algorithm
-    )
+    alg_registry_dialog = gui_c.analysis_alg_registry_dialog()
+    core_c.analysis_alg_registered_signal().connect(alg_registry_dialog.add_algorithm)
     core_c.analysis_alg_env_prep_signal().connect(
         core_c.analysis_alg_registry().prepare_environment
     )
     core_c.analysis_alg_env_prep_task_started_signal().connect(
-        gui_c.analysis_alg_registry_dialog().open_env_prep_progress_dialog
+        alg_registry_dialog.open_env_prep_progress_dialog
     )
     core_c.analysis_alg_env_prep_progress_signal().connect(
-        gui_c.analysis_alg_registry_dialog().update_env_prep_progress_dialog
+        alg_registry_dialog.update_env_prep_progress_dialog
     )
 
     # ------------------------------------- analysis manager ------------------------------------- #
@@ -233,7 +246,7 @@ def connect_signals(core_c: Container) -> None:
     # ------------------------------------- menu bar signals ------------------------------------- #
 
     gui_c.menu_bar_file_open().signal.connect(gui_c.media_source_selection_dialog().open_clean)
-    gui_c.menu_bar_algorithms().signal.connect(gui_c.analysis_alg_registry_dialog().open)
+    gui_c.menu_bar_algorithms().signal.connect(alg_registry_dialog.open)
 
 
 def run_gui(gui_c: gui.container.Container) -> int:
@@ -246,11 +259,6 @@ def run_gui(gui_c: gui.container.Container) -> int:
     palette.setColor(
         palette.ColorRole.ToolTipText, palette.color(palette.ColorRole.PlaceholderText)
     )
-    # palette.setColor(
-    #     palette.ColorGroup.Disabled,
-    #     palette.ColorRole.Button,
-    #     palette.color(palette.ColorRole.Button).darker(150),
-    # )
     qt_app.setPalette(palette)
 
     jb_main_window.show()
@@ -18,6 +18,7 @@
 import enum
 import numpy as np
 from dataclasses import dataclass
+from functools import cache
 from fractions import Fraction
 
 
@@ -26,7 +27,7 @@ class MediaType(enum.Enum):
     VIDEO = "video"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AudioSampleFormat:
     class DataType(enum.Enum):
         NONE = 0
@@ -113,16 +114,17 @@ class AudioChannelLayout(enum.Flag):
         return AudioChannelLayout.LAYOUT_MONO
 
     @staticmethod
-    def get_all_standard_layouts() -> list["AudioChannelLayout"]:
-        return [
+    @cache
+    def get_all_standard_layouts() -> tuple["AudioChannelLayout", ...]:
+        return tuple(
             layout
             for layout in AudioChannelLayout.__members__.values()
             if layout & AudioChannelLayout._LAYOUT_MARK
             and layout != AudioChannelLayout._LAYOUT_MARK
-        ]
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioConstraints:
     sample_formats: list[AudioSampleFormat]
     channel_layouts: AudioChannelLayout
@@ -132,12 +134,9 @@ class AudioConstraints:
     sample_rate_max: int
 
     def __post_init__(self):
-        super().__setattr__(
-            "sample_formats",
-            sorted(
-                self.sample_formats,
-                key=lambda sample_format: (sample_format.data_type.value, sample_format.is_planar),
-            ),
+        self.sample_formats = sorted(
+            self.sample_formats,
+            key=lambda sample_format: (sample_format.data_type.value, sample_format.is_planar),
         )
 
     def is_valid(self) -> bool:
@@ -151,7 +150,7 @@ class AudioConstraints:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioConfig:
     sample_format: AudioSampleFormat
     channel_layout: AudioChannelLayout
@@ -171,7 +170,7 @@ class AudioConfig:
         return self.channels_num * self.sample_format.dtype.itemsize
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoConfig:
     class PixelFormat(enum.Enum):
         RGBA8888 = enum.auto()
@@ -235,7 +235,7 @@ class QtAudioSourceDevice(QtC.QIODevice):
         self.open(QtC.QIODevice.OpenModeFlag.ReadWrite)
 
     def readData(self, maxSize: int) -> bytes:
-        wanted_samples_num = int(maxSize / self._bytes_per_sample)
+        wanted_samples_num = maxSize // self._bytes_per_sample
         try:
             audio = self._decoder.pop(wanted_samples_num, timeout=0)
         except TimeoutError:
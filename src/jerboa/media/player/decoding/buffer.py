@@ -27,7 +27,7 @@ AUDIO_BUFFER_SIZE_MODIFIER = 1.2
 
 class AudioBuffer:
     def __init__(self, audio_config: AudioConfig, max_duration: float):
-        self._audio_config = audio_config
+        self._sample_rate = audio_config.sample_rate
 
         self._audio = create_circular_audio_buffer(
             dtype=audio_config.sample_format.dtype,
@@ -37,7 +37,9 @@ class AudioBuffer:
             max_duration=max_duration,
         )
         # self._audio_last_sample = np.zeros(self._audio.get_shape_for_data(1), self._audio.dtype)
-        self._current_timepoint: float | None = None
+        # timepoints are derived from the number of popped samples, so they do not drift
+        self._beg_timepoint: float | None = None
+        self._popped_samples_num = 0
 
         self._max_samples = int(max_duration * audio_config.sample_rate)
 
@@ -46,15 +48,18 @@ class AudioBuffer:
 
     @property
     def duration(self) -> float:
-        return len(self._audio) / self._audio_config.sample_rate
+        return len(self._audio) / self._sample_rate
 
     @property
     def current_timepoint(self) -> float | None:
-        return self._current_timepoint
+        if self._beg_timepoint is None:
+            return None
+        return self._beg_timepoint + self._popped_samples_num / self._sample_rate
 
     def clear(self) -> None:
         self._audio.clear()
-        self._current_timepoint = None
+        self._beg_timepoint = None
+        self._popped_samples_num = 0
         # self._audio_last_sample[:] = 0
 
     def put(self, audio_frame: JbAudioFrame) -> None:
@@ -63,8 +68,8 @@ class AudioBuffer:
         self._audio.put(audio_frame.audio_signal)
         # self._audio_last_sample[:] = self._audio[-1]
 
-        if self._current_timepoint is None:
-            self._current_timepoint = audio_frame.beg_timepoint
+        if self._beg_timepoint is None:
+            self._beg_timepoint = audio_frame.beg_timepoint
 
     def pop(self, samples_num: int) -> JbAudioFrame:
         assert not self.is_empty()
@@ -72,23 +77,20 @@ class AudioBuffer:
         all_samples_num = len(self._audio)
         pop_samples_num = min(all_samples_num, samples_num)
 
-        audio_signal = self._audio.pop(pop_samples_num)
-        audio_duration = pop_samples_num / self._audio_config.sample_rate
+        beg_timepoint = self.current_timepoint
+        self._popped_samples_num += pop_samples_num
 
-        frame = JbAudioFrame(
-            beg_timepoint=self._current_timepoint,
-            end_timepoint=self._current_timepoint + audio_duration,
-            audio_signal=audio_signal,
+        return JbAudioFrame(
+            beg_timepoint=beg_timepoint,
+            end_timepoint=self.current_timepoint,
+            audio_signal=self._audio.pop(pop_samples_num),
         )
-        self._current_timepoint = frame.end_timepoint
-
-        return frame
 
     def is_empty(self) -> bool:
-        return len(self) == 0
+        return len(self._audio) == 0
 
     def is_full(self) -> bool:
-        return len(self) >= self._max_samples
+        return len(self._audio) >= self._max_samples
 
 
 class VideoBuffer:
@@ -129,14 +131,15 @@ class VideoBuffer:
 
         frame = self._frames.popleft()
         self._duration -= frame.duration
-        self._duration *= not self.is_empty()  # ensure `_duration == 0` when `is_empty() == true`
+        if not self._frames:
+            self._duration = 0.0  # drop the accumulated rounding error
 
         self._current_timepoint = frame.end_timepoint
 
         return frame
 
     def is_empty(self) -> bool:
-        return len(self) == 0
+        return len(self._frames) == 0
 
     def is_full(self) -> bool:
         return self._duration >= self._max_duration
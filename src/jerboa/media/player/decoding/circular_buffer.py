@@ -40,6 +40,9 @@ class CircularBuffer:
         except IndexError as exc:
             raise ValueError(f"Wrong index axis! {index_axis=}, {shape=}.") from exc
 
+        # leading full slices of every index tuple, so indexing does not have to build a list
+        self._index_prefix = (slice(None),) * (index_axis % len(shape))
+
     def __repr__(self) -> str:
         return np.concatenate(self._get(self._size), self._axis).__repr__()
 
@@ -71,9 +74,7 @@ class CircularBuffer:
         return self.data[self._index_samples(idx, idx + 1)]
 
     def _index_samples(self, beg: int, end: int) -> tuple[slice]:
-        indices = [slice(None) for _ in range(self.data.ndim)]
-        indices[self._axis] = slice(beg, end)
-        return tuple(indices)
+        return self._index_prefix + (slice(beg, end),)
 
     @property
     def index_axis(self) -> int:
@@ -134,13 +135,8 @@ class CircularBuffer:
         new_shape[self._axis] = new_max_size
         self.data = np.zeros(new_shape, dtype=self.dtype)
 
-        write_indices = [slice(None) for _ in range(self.data.ndim)]
-
-        write_indices[self._axis] = slice(data1_size)
-        self.data[tuple(write_indices)] = data_part1
-
-        write_indices[self._axis] = slice(data1_size, data1_size + data2_size)
-        self.data[tuple(write_indices)] = data_part2
+        self.data[self._index_samples(None, data1_size)] = data_part1
+        self.data[self._index_samples(data1_size, data1_size + data2_size)] = data_part2
 
     def put(self, data: np.ndarray) -> None:
         """
@@ -156,9 +152,10 @@ class CircularBuffer:
         resulting_size = self._size + insert_size
         if resulting_size > self.max_size:
             self.resize(int(resulting_size * GROWTH_MULTIPLIER))
+        max_size = self.max_size
 
         idx_beg = self._tail
-        idx_end = min(self.max_size, idx_beg + insert_size)
+        idx_end = min(max_size, idx_beg + insert_size)
         idx_overflow = insert_size - (idx_end - idx_beg)
         assert idx_overflow <= self._head and (self._tail >= self._head or idx_end <= self._head)
 
@@ -170,7 +167,7 @@ class CircularBuffer:
         read_indices = self._index_samples(idx_end - idx_beg, None)  # idx_end - idx_beg:
         self.data[write_indices] = data[read_indices]
 
-        self._tail = (self._tail + insert_size) % self.max_size
+        self._tail = (self._tail + insert_size) % max_size
         self._size += insert_size
 
     def pop(self, pop_size: int) -> np.ndarray:
@@ -221,13 +218,8 @@ class CircularBuffer:
         idx_end = min(self.max_size, idx_beg + count)
         idx_overflow = count - (idx_end - idx_beg)
 
-        read_indices = [slice(None) for _ in range(self.data.ndim)]
-
-        read_indices[self._axis] = slice(idx_beg, idx_end)  # idx_beg:idx_end
-        part1 = self.data[tuple(read_indices)]
-
-        read_indices[self._axis] = slice(idx_overflow)  # :idx_overflow
-        part2 = self.data[tuple(read_indices)]
+        part1 = self.data[self._index_samples(idx_beg, idx_end)]  # idx_beg:idx_end
+        part2 = self.data[self._index_samples(None, idx_overflow)]  # :idx_overflow
 
         return (part1, part2)
 
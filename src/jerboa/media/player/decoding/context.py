@@ -170,10 +170,11 @@ class DecodingContext:
     min_timepoint: float = field(default=0, init=False)
     mean_keyframe_interval: float = field(default=DEFAULT_MEAN_KEYFRAME_INTERVAL, init=False)
 
-    def seek(self, timepoint: float) -> None:
+    def seek(self, timepoint: float, *, seek_container: bool = True) -> None:
         assert timepoint >= 0
 
-        self.media.avc.container.seek(round(timepoint * av.time_base))
+        if seek_container:
+            self.media.avc.container.seek(round(timepoint * av.time_base))
         self.last_seek_timepoint = timepoint
         self.min_timepoint = timepoint
 
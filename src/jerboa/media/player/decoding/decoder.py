@@ -18,7 +18,14 @@
 from dataclasses import dataclass
 
 from jerboa.log import logger
-from jerboa.core.multithreading import ThreadSpawner, Task, FnTask, PredicateEmitter, Thread
+from jerboa.core.multithreading import (
+    ThreadPool,
+    ThreadSpawner,
+    Task,
+    FnTask,
+    PredicateEmitter,
+    Thread,
+)
 from jerboa.media.core import MediaType, AudioConfig, VideoConfig, AudioConstraints
 from .buffer import create_buffer
 from .context import DecodingContext
@@ -68,7 +75,8 @@ class Decoder:
 
         self._logger = logger.bind(context=f"{self.__class__.__name__}({self.media_type})")
 
-        self.seek(self._context.media.avc.start_timepoint)
+        # the container has just been opened, so it is already positioned at the start
+        self._context.seek(self._context.media.avc.start_timepoint, seek_container=False)
         thread_spawner.start(self.__thread)
 
     @property
@@ -256,9 +264,11 @@ def create_audio_decoder(
 def create_video_decoder(
     context: DecodingContext,
     thread_spawner: ThreadSpawner,
+    thread_pool: ThreadPool,
 ) -> Decoder:
     return Decoder(
         output_node=node.VideoPresentationReformattingNode(
+            thread_pool=thread_pool,
             parent=node.FrameMappingNode(
                 parent=node.FrameMappingPreparationNode(
                     parent=node.SemiAccurateSeekNode(
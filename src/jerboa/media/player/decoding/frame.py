@@ -22,7 +22,7 @@ from dataclasses import dataclass, field
 from jerboa.core.timeline import RangeMappingResult
 
 
-@dataclass
+@dataclass(slots=True)
 class TimedFrame:
     beg_timepoint: float
     end_timepoint: float
@@ -32,22 +32,22 @@ class TimedFrame:
         return self.end_timepoint - self.beg_timepoint
 
 
-@dataclass
+@dataclass(slots=True)
 class TimedAVFrame(TimedFrame):
     av_frame: av.AudioFrame | av.VideoFrame = field(repr=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class PreMappedFrame(TimedAVFrame):
     mapping_scheme: RangeMappingResult | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MappedAudioFrame(TimedFrame):
     audio_signal: np.ndarray = field(repr=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class MappedVideoFrame(TimedFrame):
     av_frame: av.VideoFrame = field(repr=False)
 
@@ -55,7 +55,7 @@ class MappedVideoFrame(TimedFrame):
 JbAudioFrame = MappedAudioFrame
 
 
-@dataclass
+@dataclass(slots=True)
 class JbVideoFrame(TimedFrame):
     width: int
     height: int
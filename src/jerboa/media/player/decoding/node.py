@@ -24,6 +24,7 @@ from typing import Any, Callable, Optional
 from abc import ABC, abstractmethod
 
 from jerboa.core.jbmath import Fraction
+from jerboa.core.multithreading import ThreadPool, Task, FnTask
 from jerboa.core.timeline import FragmentedTimeline
 from jerboa.media import standardized_audio as std_audio
 from jerboa.media.core import MediaType
@@ -191,17 +192,20 @@ class KeyframeIntervalWatcherNode(Node):
 
         self._sample_size: int = 0
         self._last_keyframe_timepoint: float | None = None
+        self._time_base: float | None = None
 
     def reset(self, context: DecodingContext, reason: Node.ResetReason, *, recursive: bool) -> None:
         self._sample_size = 0
         self._last_keyframe_timepoint = None
+        if reason == Node.ResetReason.NEW_CONTEXT:
+            self._time_base = float(context.media.avc.stream.time_base)
         super().reset(context, reason, recursive=recursive)
 
     def pull(self, context: DecodingContext) -> av.Packet | None:
         packet: av.Packet = self.parent.pull(context)
 
         if packet is not None and packet.is_keyframe:
-            keyframe_timepoint = packet.pts * float(packet.time_base)
+            keyframe_timepoint = packet.pts * self._time_base
             if self._last_keyframe_timepoint is not None:
                 new_interval = keyframe_timepoint - self._last_keyframe_timepoint
                 intervals_sum = (context.mean_keyframe_interval * self._sample_size) + new_interval
@@ -260,9 +264,14 @@ class AudioFrameTimingCorrectionNode(Node):
                 Fraction(context.media.avc.stream.time_base) / std_time_base
             )
             if frame_time_base_to_std_time_base != 1:
+                # integers, to avoid Fraction arithmetic for every frame
+                pts_multiplier = frame_time_base_to_std_time_base.numerator
+                pts_divisor = frame_time_base_to_std_time_base.denominator
 
                 def time_base_standardizer(frame: av.AudioFrame):
-                    frame.pts = int(frame.pts * frame_time_base_to_std_time_base)
+                    pts = frame.pts * pts_multiplier
+                    # truncate toward zero, like `int()` (priming frames have negative pts)
+                    frame.pts = pts // pts_divisor if pts >= 0 else -(-pts // pts_divisor)
                     frame.time_base = std_time_base
 
                 self._frame_time_base_standardizer = time_base_standardizer
@@ -454,7 +463,9 @@ class FrameMappingPreparationNode(Node):
                     if mapping_scheme.beg < mapping_scheme.end:
                         self._returned_frame = True
                         return PreMappedFrame(
-                            **vars(frame),
+                            beg_timepoint=frame.beg_timepoint,
+                            end_timepoint=frame.end_timepoint,
+                            av_frame=frame.av_frame,
                             mapping_scheme=mapping_scheme,
                         )
 
@@ -524,16 +535,36 @@ class AudioPresentationReformattingNode(Node):
 
 
 class VideoPresentationReformattingNode(Node):
-    def __init__(self, parent: Optional["Node"] = None) -> None:
+    def __init__(self, thread_pool: ThreadPool, parent: Optional["Node"] = None) -> None:
         super().__init__(
             input_types={MappedVideoFrame},
             output_types={JbVideoFrame},
             breaks_on_discontinuity=False,
             parent=parent,
         )
+        self._thread_pool = thread_pool
         self._reformatter: VideoReformatter | None = None
 
+        # Filter graph is quite slow, so the current frame is reformatted in the background while
+        # the next one is pulled. The cost is a one frame lookahead: the current frame is returned
+        # only once the next one is available, e.g. when the timeline covers it.
+        self._frame: MappedVideoFrame | None = None
+        self._frame_planes: Task.Future[list[np.ndarray]] | None = None
+        self._next_frame: MappedVideoFrame | None = None
+        self._has_next_frame = False
+
     def reset(self, context: DecodingContext, reason: Node.ResetReason, *, recursive: bool) -> None:
+        self._next_frame = None
+        self._has_next_frame = False
+        if reason != Node.ResetReason.SOFT_DISCONTINUITY:
+            # a skip interrupts only the prefetch, the current frame was mapped before it and is
+            # still delivered
+            if self._frame_planes is not None:
+                # the filter graph cannot be used by 2 threads at once
+                self._frame_planes.wait(finishing_aborted=True)
+            self._frame = None
+            self._frame_planes = None
+
         if reason == Node.ResetReason.NEW_CONTEXT:
             self._reformatter = VideoReformatter(context.media.presentation_config)
         else:
@@ -541,13 +572,36 @@ class VideoPresentationReformattingNode(Node):
         super().reset(context, reason, recursive=recursive)
 
     def pull(self, context: DecodingContext) -> JbVideoFrame | None:
-        frame: MappedVideoFrame = self.parent.pull(context)
-        if frame is not None:
-            return JbVideoFrame(
-                beg_timepoint=frame.beg_timepoint,
-                end_timepoint=frame.end_timepoint,
-                width=frame.av_frame.width,
-                height=frame.av_frame.height,
-                planes=self._reformatter.reformat(frame.av_frame),
-            )
-        return None
+        if self._frame is None:
+            if not self._has_next_frame:
+                self._pull_next_frame(context)
+            if self._next_frame is None:
+                return None
+            self._frame = self._next_frame
+            self._frame_planes = self._reformat(self._next_frame.av_frame)
+            self._has_next_frame = False
+
+        # if this raises, the current frame is kept and returned by the next call
+        self._pull_next_frame(context)
+
+        frame, frame_planes = self._frame, self._frame_planes.result(timeout=None)
+        self._frame = None
+        self._frame_planes = None
+        return JbVideoFrame(
+            beg_timepoint=frame.beg_timepoint,
+            end_timepoint=frame.end_timepoint,
+            width=frame.av_frame.width,
+            height=frame.av_frame.height,
+            planes=frame_planes,
+        )
+
+    def _pull_next_frame(self, context: DecodingContext) -> None:
+        self._has_next_frame = False
+        self._next_frame = self.parent.pull(context)
+        self._has_next_frame = True
+
+    def _reformat(self, av_frame: av.VideoFrame) -> Task.Future[list[np.ndarray]]:
+        reformatter = self._reformatter
+        return self._thread_pool.start(
+            FnTask(lambda executor: executor.finish(reformatter.reformat(av_frame)))
+        )
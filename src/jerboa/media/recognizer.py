@@ -32,26 +32,17 @@ class MediaSourceRecognizer:
     def recognize(
         self,
         media_source_path: JbPath,
-        success_signal: Signal,
-        failure_signal: Signal,
+        finished_signal: Signal,
     ) -> FnTask.Future:
         return self._thread_pool.start(
-            FnTask(
-                lambda executor: self._recognize(
-                    executor,
-                    media_source_path,
-                    success_signal,
-                    failure_signal,
-                )
-            )
+            FnTask(lambda executor: self._recognize(executor, media_source_path, finished_signal))
         )
 
     def _recognize(
         self,
         executor: FnTask.Executor,
         media_source_path: JbPath,
-        success_signal: Signal,
-        failure_signal: Signal,
+        finished_signal: Signal,
     ):
         import av
 
@@ -91,7 +82,7 @@ class MediaSourceRecognizer:
                     recognition_error_message = str(err)
 
         with executor.finish_context:
-            if media_source is not None:
-                success_signal.emit(media_source=media_source)
-            else:
-                failure_signal.emit(error_message=recognition_error_message)
+            finished_signal.emit(
+                media_source=media_source,
+                error_message=recognition_error_message,
+            )
@@ -0,0 +1,8 @@
+import pytest
+
+from jerboa.log import logger
+
+
+@pytest.fixture(scope="session", autouse=True)
+def initialize_logger():
+    logger.initialize(name="Test")
@@ -0,0 +1,167 @@
+import pytest
+
+import av
+import numpy as np
+from types import SimpleNamespace
+
+from jerboa.core.jbmath import Fraction
+from jerboa.core.timeline import FragmentedTimeline
+from jerboa.core.multithreading import PyThreadPool
+from jerboa.media.core import VideoConfig
+from jerboa.media.player.decoding.context import DecodingContext, SkipDiscardedFramesSeekTask
+from jerboa.media.player.decoding.frame import MappedVideoFrame
+from jerboa.media.player.decoding.node import (
+    Node,
+    AudioFrameTimingCorrectionNode,
+    VideoPresentationReformattingNode,
+)
+
+FRAMES_NUM = 6
+
+
+@pytest.fixture(scope="module")
+def thread_pool() -> PyThreadPool:
+    return PyThreadPool(workers=2)
+
+
+class StubVideoNode(Node):
+    """Returns `FRAMES_NUM` mapped frames and raises a skip task on the selected pulls."""
+
+    def __init__(self, skip_on_pulls: set[int]) -> None:
+        super().__init__(
+            input_types={type(None)},
+            output_types={MappedVideoFrame},
+            breaks_on_discontinuity=False,
+            parent=None,
+        )
+        self._skip_on_pulls = skip_on_pulls
+        self.pulls_num = 0
+        self._frame_idx = 0
+
+    def reset(self, context: DecodingContext, reason: Node.ResetReason, *, recursive: bool) -> None:
+        if reason != Node.ResetReason.SOFT_DISCONTINUITY:
+            self._frame_idx = 0
+        super().reset(context, reason, recursive=recursive)
+
+    def pull(self, context: DecodingContext) -> MappedVideoFrame | None:
+        self.pulls_num += 1
+        if self.pulls_num in self._skip_on_pulls:
+            SkipDiscardedFramesSeekTask(timepoint=0).run_pending()
+
+        if self._frame_idx >= FRAMES_NUM:
+            return None
+
+        av_frame = av.VideoFrame.from_ndarray(
+            np.full((4, 4, 3), self._frame_idx, dtype=np.uint8), format="rgb24"
+        )
+        av_frame.time_base = Fraction(1, 1)
+        av_frame.pts = self._frame_idx
+
+        frame = MappedVideoFrame(
+            beg_timepoint=self._frame_idx,
+            end_timepoint=self._frame_idx + 1,
+            av_frame=av_frame,
+        )
+        self._frame_idx += 1
+        return frame
+
+
+def create_context() -> DecodingContext:
+    container = SimpleNamespace(seek=lambda _: None)
+    return DecodingContext(
+        media=SimpleNamespace(
+            avc=SimpleNamespace(container=container),
+            presentation_config=VideoConfig(
+                pixel_format=VideoConfig.PixelFormat.RGBA8888,
+                sample_aspect_ratio=Fraction(1, 1),
+            ),
+        ),
+        timeline=FragmentedTimeline(),
+    )
+
+
+def pull_all(output_node: Node, context: DecodingContext) -> list[float]:
+    timepoints = []
+    while (frame := output_node.pull_as_leaf(context)) is not None:
+        timepoints.append(frame.beg_timepoint)
+    return timepoints
+
+
+@pytest.mark.parametrize("skip_on_pulls", [set(), {1}, {2}, {3}, {3, 5}, {FRAMES_NUM + 1}])
+def test_video_presentation_reformatting_node_should_not_drop_frames_on_skip(
+    thread_pool: PyThreadPool,
+    skip_on_pulls: set[int],
+):
+    context = create_context()
+    output_node = VideoPresentationReformattingNode(
+        thread_pool=thread_pool, parent=StubVideoNode(skip_on_pulls)
+    )
+    output_node.reset(context, Node.ResetReason.NEW_CONTEXT, recursive=True)
+
+    assert pull_all(output_node, context) == list(range(FRAMES_NUM))
+
+
+def test_video_presentation_reformatting_node_should_drop_frames_on_seek(
+    thread_pool: PyThreadPool,
+):
+    context = create_context()
+    output_node = VideoPresentationReformattingNode(
+        thread_pool=thread_pool, parent=StubVideoNode(set())
+    )
+    output_node.reset(context, Node.ResetReason.NEW_CONTEXT, recursive=True)
+
+    output_node.pull_as_leaf(context)
+    output_node.find_root_node().reset(
+        context, Node.ResetReason.HARD_DISCONTINUITY, recursive=True
+    )
+
+    assert pull_all(output_node, context) == list(range(FRAMES_NUM))
+
+
+def test_video_presentation_reformatting_node_should_look_ahead_by_one_frame(
+    thread_pool: PyThreadPool,
+):
+    context = create_context()
+    parent = StubVideoNode(set())
+    output_node = VideoPresentationReformattingNode(thread_pool=thread_pool, parent=parent)
+    output_node.reset(context, Node.ResetReason.NEW_CONTEXT, recursive=True)
+
+    # a frame is returned only after the next one has been pulled (or the parent reached EOF)
+    for frame_idx in range(FRAMES_NUM):
+        assert output_node.pull_as_leaf(context).beg_timepoint == frame_idx
+        assert parent.pulls_num == frame_idx + 2
+    assert output_node.pull_as_leaf(context) is None
+    assert parent.pulls_num == FRAMES_NUM + 1
+
+
+class StubAudioNode(Node):
+    """Returns a single audio frame with the given pts."""
+
+    def __init__(self, pts: int) -> None:
+        super().__init__(
+            input_types={type(None)},
+            output_types={av.AudioFrame},
+            breaks_on_discontinuity=False,
+            parent=None,
+        )
+        self._pts = pts
+
+    def pull(self, context: DecodingContext) -> av.AudioFrame | None:
+        frame = av.AudioFrame(format="s16", layout="mono", samples=4)
+        frame.pts = self._pts
+        return frame
+
+
+@pytest.mark.parametrize("pts, std_pts", [(0, 0), (3, 132), (-3, -132), (-1000, -44100)])
+def test_audio_frame_timing_correction_node_should_truncate_standardized_pts(
+    pts: int, std_pts: int
+):
+    stream = SimpleNamespace(sample_rate=44100, time_base=Fraction(1, 1000))
+    context = DecodingContext(
+        media=SimpleNamespace(avc=SimpleNamespace(stream=stream)),
+        timeline=FragmentedTimeline(),
+    )
+    output_node = AudioFrameTimingCorrectionNode(parent=StubAudioNode(pts))
+    output_node.reset(context, Node.ResetReason.NEW_CONTEXT, recursive=True)
+
+    assert output_node.pull(context).pts == std_pts